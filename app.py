@@ -1,8 +1,20 @@
 import random
+import sys
+import argparse
 import codecs
+import gc
+import hashlib
+import json
+import os
+import multiprocessing
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from abc import ABC, abstractmethod
 import time
-from statistics import mean
+from array import array
+from operator import itemgetter
+from math import sqrt
+from statistics import NormalDist, mean, stdev
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -10,6 +22,13 @@ from opentelemetry.exporter.jaeger.thrift import JaegerExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.semconv.resource import ResourceAttributes
 
+# NumPy é opcional: só é necessário para a ordenação vetorizada em lote,
+# para a geração paralela de dados e para o motor numpy do sample_sort
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configurar o recurso com o nome do serviço
 resource = Resource(attributes={
     ResourceAttributes.SERVICE_NAME: "sorting_algorithms"
@@ -37,27 +56,137 @@ class RandomNumberStrategy(ABC):
         pass
 
 class UniqueRandomNumberStrategy(RandomNumberStrategy):
+    def __init__(self, seed=None):
+        # Com seed=None mantém o comportamento antigo (dados diferentes a cada execução)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
     def generate_numbers(self, num, start, end):
         with tracer.start_as_current_span("generate_unique_numbers") as span:
             arr = []
-            tmp = random.randint(start, end)
+            seen = set()
+            tmp = self.rng.randint(start, end)
             for x in range(num):
-                while tmp in arr:
-                    tmp = random.randint(start, end)
+                while tmp in seen:
+                    tmp = self.rng.randint(start, end)
                 arr.append(tmp)
+                seen.add(tmp)
             arr.sort()
             span.set_attribute("generated_numbers_count", len(arr))
             return arr
 
+def _generate_unique_chunk(seed_sequence, range_size, count, offset):
+    rng = np.random.Generator(np.random.PCG64(seed_sequence))
+    chunk = rng.choice(range_size, size=count, replace=False) + offset
+    chunk.sort()
+    return chunk
+
+class ParallelUniqueRandomNumberStrategy(RandomNumberStrategy):
+    # Fixo de propósito: o resultado depende só de (estratégia, n, intervalo, seed),
+    # nunca do número de processos usados
+    CHUNK_SIZE = 1_000_000
+
+    def __init__(self, seed=None, max_workers=None):
+        if np is None:
+            raise RuntimeError("NumPy é necessário para a geração paralela")
+        self.seed = seed
+        self.max_workers = max_workers
+
+    def generate_numbers(self, num, start, end):
+        with tracer.start_as_current_span("generate_unique_numbers_parallel") as span:
+            total = end - start + 1
+            if num > total:
+                raise ValueError("O intervalo não tem números distintos suficientes")
+            if total >= 10**9:
+                # Limite da hipergeométrica multivariada do NumPy
+                raise ValueError("O intervalo deve ter menos de 10**9 números")
+            num_chunks = max(1, min(-(-num // self.CHUNK_SIZE), total))
+            # O intervalo é dividido em faixas contíguas e a quantidade de números
+            # de cada faixa é sorteada de uma hipergeométrica multivariada, o que
+            # equivale a sortear num valores distintos do intervalo inteiro
+            bounds = [start + total * i // num_chunks for i in range(num_chunks + 1)]
+            sizes = [bounds[i + 1] - bounds[i] for i in range(num_chunks)]
+            root = np.random.SeedSequence(self.seed)
+            counts = np.random.Generator(np.random.PCG64(root)).multivariate_hypergeometric(sizes, num)
+            # Cada faixa recebe um fluxo aleatório independente
+            tasks = list(zip(root.spawn(num_chunks), sizes, counts.tolist(), bounds))
+            if num_chunks == 1:
+                chunks = [_generate_unique_chunk(*tasks[0])]
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    chunks = list(executor.map(_generate_unique_chunk, *zip(*tasks)))
+            arr = np.concatenate(chunks).tolist()
+            span.set_attributes({
+                "generated_numbers_count": len(arr),
+                "chunks": num_chunks
+            })
+            return arr
+
+class DatasetCorpus:
+    # Arquivos de dados são endereçados pelo SHA-256 do conteúdo; um índice por
+    # especificação (estratégia, n, intervalo, seed) aponta para o arquivo
+    def __init__(self, directory="corpus"):
+        self.directory = directory
+
+    def _spec(self, strategy, num, start, end):
+        if getattr(strategy, "seed", None) is None:
+            raise ValueError("Só conjuntos gerados com seed podem ir para o corpus")
+        return {
+            "strategy": type(strategy).__name__,
+            "num": num,
+            "start": start,
+            "end": end,
+            "seed": strategy.seed
+        }
+
+    def _spec_path(self, spec):
+        digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "specs", digest + ".json")
+
+    def _data_path(self, content_hash):
+        return os.path.join(self.directory, content_hash + ".txt")
+
+    def get_or_create(self, strategy, num, start, end):
+        with tracer.start_as_current_span("corpus_get_or_create") as span:
+            spec = self._spec(strategy, num, start, end)
+            spec_path = self._spec_path(spec)
+            if os.path.exists(spec_path):
+                with codecs.open(spec_path, "r", "utf-8") as file:
+                    content_hash = json.load(file)["sha256"]
+                data_path = self._data_path(content_hash)
+                if os.path.exists(data_path):
+                    span.set_attribute("cache_hit", True)
+                    return data_path, load_data(data_path)
+
+            span.set_attribute("cache_hit", False)
+            # Num cache miss a lista gerada é devolvida direto, sem reler o arquivo
+            arr = strategy.generate_numbers(num, start, end)
+            content = ','.join(map(str, arr))
+            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            data_path = self._data_path(content_hash)
+            os.makedirs(os.path.dirname(spec_path), exist_ok=True)
+            if not os.path.exists(data_path):
+                with codecs.open(data_path + ".tmp", "w", "utf-8") as file:
+                    file.write(content)
+                os.replace(data_path + ".tmp", data_path)
+            with codecs.open(spec_path, "w", "utf-8") as file:
+                json.dump(dict(spec, sha256=content_hash), file, indent=2)
+            return data_path, arr
+
 class RandomNumberGenerator:
-    def __init__(self, strategy: RandomNumberStrategy):
+    def __init__(self, strategy: RandomNumberStrategy, corpus: DatasetCorpus = None):
         self.strategy = strategy
+        self.corpus = corpus
+        self.path = "Data.txt"
 
     def create_random_number_list(self, num, start=1, end=100):
         with tracer.start_as_current_span("create_random_number_list") as span:
-            arr = self.strategy.generate_numbers(num, start, end)
-            with codecs.open("Data.txt", "w", "utf-8") as file:
-                file.write(','.join(map(str, arr)))
+            if self.corpus is not None:
+                self.path, arr = self.corpus.get_or_create(self.strategy, num, start, end)
+            else:
+                arr = self.strategy.generate_numbers(num, start, end)
+                with codecs.open(self.path, "w", "utf-8") as file:
+                    file.write(','.join(map(str, arr)))
             span.set_attribute("list_size", len(arr))
             return arr
 
@@ -66,18 +195,56 @@ class Metrics:
         self.time_ms = 0
         self.comparisons = 0
         self.swaps = 0
+        # False quando as trocas não puderam ser observadas (ver count_operations)
+        self.moves_available = True
 
-def load_data():
+def load_data(path="Data.txt"):
     with tracer.start_as_current_span("load_data") as span:
-        with codecs.open("Data.txt", "r", "utf-8") as file:
+        with codecs.open(path, "r", "utf-8") as file:
             data = [int(x) for x in file.read().split(',')]
             span.set_attribute("loaded_numbers_count", len(data))
             return data
 
+# Decorate-sort-undecorate: as chaves são calculadas uma única vez e cada
+# elemento vira uma chave com o índice de origem, o que mantém a estabilidade
+def _float_sort_keys(keys):
+    # Caminho tipado: os bits IEEE 754 lidos como int64 e com a magnitude dos
+    # negativos invertida ficam na mesma ordem dos floats (+0.0 une -0.0 e 0.0)
+    bits = array('q')
+    bits.frombytes(array('d', [k + 0.0 for k in keys]).tobytes())
+    return [b if b >= 0 else b ^ 0x7FFFFFFFFFFFFFFF for b in bits]
+
+def _decorate(arr, key=None, reverse=False):
+    if key is None and not reverse:
+        return arr.copy(), None
+    # Com reverse, ordenar a entrada invertida e inverter o resultado mantém
+    # os elementos iguais na ordem original, como no sorted() do Python
+    items = list(reversed(arr)) if reverse else list(arr)
+    if key is None:
+        return items, lambda result: result[::-1]
+
+    keys = [key(x) for x in items]
+    n = len(keys)
+    if all(type(k) is float for k in keys):
+        keys = _float_sort_keys(keys)
+    if all(type(k) is int for k in keys):
+        # Chave e índice empacotados num único int: comparações entre ints simples
+        decorated = [k * n + i for i, k in enumerate(keys)]
+        restore = lambda result: [items[d % n] for d in result]
+    else:
+        decorated = [(k, i) for i, k in enumerate(keys)]
+        restore = lambda result: [items[i] for _, i in result]
+    if reverse:
+        return decorated, lambda result: restore(result)[::-1]
+    return decorated, restore
+
+def _undecorate(result, restore):
+    return result if restore is None else restore(result)
+
 # Algoritmos de ordenação com tracing
-def bubble_sort(arr):
+def bubble_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     with tracer.start_as_current_span("bubble_sort") as span:
         n = len(arr_copy)
         for i in range(n):
@@ -91,11 +258,11 @@ def bubble_sort(arr):
             "swaps": metrics.swaps,
             "array_size": n
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
 
-def bubble_sort_improved(arr):
+def bubble_sort_improved(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     with tracer.start_as_current_span("bubble_sort_improved") as span:
         n = len(arr_copy)
         for i in range(n):
@@ -113,11 +280,11 @@ def bubble_sort_improved(arr):
             "swaps": metrics.swaps,
             "array_size": n
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
 
-def insertion_sort(arr):
+def insertion_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     with tracer.start_as_current_span("insertion_sort") as span:
         n = len(arr_copy)
         for i in range(1, n):
@@ -139,11 +306,11 @@ def insertion_sort(arr):
             "swaps": metrics.swaps,
             "array_size": n
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
 
-def selection_sort(arr):
+def selection_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     with tracer.start_as_current_span("selection_sort") as span:
         n = len(arr_copy)
         for i in range(n):
@@ -160,11 +327,11 @@ def selection_sort(arr):
             "swaps": metrics.swaps,
             "array_size": n
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
 
-def quick_sort(arr):
+def quick_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     
     def partition(low, high):
         pivot = arr_copy[high]
@@ -192,11 +359,11 @@ def quick_sort(arr):
             "swaps": metrics.swaps,
             "array_size": len(arr_copy)
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
 
-def merge_sort(arr):
+def merge_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     
     def merge(left, right):
         result = []
@@ -229,11 +396,11 @@ def merge_sort(arr):
             "swaps": metrics.swaps,
             "array_size": len(arr_copy)
         })
-    return sorted_arr, metrics
+    return _undecorate(sorted_arr, restore), metrics
 
-def tim_sort(arr):
+def tim_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     min_run = 32
 
     def insertion_sort_tim(start, end):
@@ -296,11 +463,11 @@ def tim_sort(arr):
             "swaps": metrics.swaps,
             "array_size": n
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
 
-def shell_sort(arr):
+def shell_sort(arr, key=None, reverse=False):
     metrics = Metrics()
-    arr_copy = arr.copy()
+    arr_copy, restore = _decorate(arr, key, reverse)
     with tracer.start_as_current_span("shell_sort") as span:
         n = len(arr_copy)
         gap = n // 2
@@ -326,16 +493,364 @@ def shell_sort(arr):
             "swaps": metrics.swaps,
             "array_size": n
         })
-    return arr_copy, metrics
+    return _undecorate(arr_copy, restore), metrics
+
+# Sample sort paralelo: os baldes são ordenados em threads sobre memória
+# compartilhada (ganho real com NumPy, que libera a GIL, ou em Python sem GIL)
+SAMPLE_SORT_OVERSAMPLING = 32
+SAMPLE_SORT_BUCKETS_PER_THREAD = 4
+SAMPLE_SORT_MIN_BUCKET_SIZE = 1024
+
+def _choose_splitters(arr, num_buckets):
+    sample_size = min(len(arr), SAMPLE_SORT_OVERSAMPLING * num_buckets)
+    sample = sorted(arr[i] for i in random.sample(range(len(arr)), sample_size))
+    step = sample_size / num_buckets
+    return [sample[int(step * b)] for b in range(1, num_buckets)]
+
+def _numpy_values(arr):
+    # Só usa o NumPy quando a conversão é exata: todos int (cabendo em int64) ou
+    # todos float; misturas, tuplas e ints grandes seriam corrompidos ou arredondados
+    if all(type(x) is int for x in arr):
+        dtype = np.int64
+    elif all(type(x) is float for x in arr):
+        dtype = np.float64
+    else:
+        return None
+    try:
+        values = np.asarray(arr, dtype=dtype)
+    except OverflowError:
+        return None
+    return values if values.ndim == 1 else None
+
+def _sample_sort_numpy(values, num_buckets, num_threads):
+    splitters = np.sort(values[np.random.choice(len(values), min(len(values),
+                        SAMPLE_SORT_OVERSAMPLING * num_buckets), replace=False)])
+    splitters = splitters[(np.arange(1, num_buckets) * len(splitters)) // num_buckets]
+    # Uma passada: índice do balde de cada elemento e agrupamento estável por
+    # balde (radix sort do NumPy para uint16), já na ordem final dos baldes
+    bucket_index = np.searchsorted(splitters, values, side="right").astype(np.uint16)
+    grouped = values[np.argsort(bucket_index, kind="stable")]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(bucket_index, minlength=num_buckets))))
+    # Cada thread ordena uma fatia disjunta do mesmo array: não há fase de merge
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        list(executor.map(lambda b: grouped[bounds[b]:bounds[b + 1]].sort(kind="stable"),
+                          range(num_buckets)))
+    return grouped.tolist()
+
+def _sample_sort_tim(arr, num_buckets, num_threads, metrics):
+    splitters = _choose_splitters(arr, num_buckets)
+    buckets = [[] for _ in range(num_buckets)]
+    for x in arr:
+        buckets[bisect_right(splitters, x)].append(x)
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        results = list(executor.map(tim_sort, buckets))
+    sorted_arr = []
+    for bucket, bucket_metrics in results:
+        sorted_arr.extend(bucket)
+        metrics.comparisons += bucket_metrics.comparisons
+        metrics.swaps += bucket_metrics.swaps
+    return sorted_arr
+
+def sample_sort(arr, key=None, reverse=False, num_threads=4, engine=None):
+    # engine: "numpy" (padrão quando disponível e os dados são numéricos) ou "tim_sort"
+    metrics = Metrics()
+    arr_copy, restore = _decorate(arr, key, reverse)
+    with tracer.start_as_current_span("sample_sort") as span:
+        n = len(arr_copy)
+        num_buckets = max(1, min(num_threads * SAMPLE_SORT_BUCKETS_PER_THREAD,
+                                 n // SAMPLE_SORT_MIN_BUCKET_SIZE))
+        engine = engine or ("numpy" if np is not None else "tim_sort")
+        values = None
+        if engine == "numpy" and np is not None:
+            values = _numpy_values(arr_copy)
+        if values is not None and num_buckets > 1:
+            sorted_arr = _sample_sort_numpy(values, num_buckets, num_threads)
+        elif values is not None:
+            sorted_arr = np.sort(values, kind="stable").tolist()
+        else:
+            # Dados sem conversão exata para NumPy, ou sem NumPy: baldes ordenados com o tim_sort deste arquivo
+            engine = "tim_sort"
+            if num_buckets > 1:
+                sorted_arr = _sample_sort_tim(arr_copy, num_buckets, num_threads, metrics)
+            else:
+                sorted_arr, bucket_metrics = tim_sort(arr_copy)
+                metrics.comparisons += bucket_metrics.comparisons
+                metrics.swaps += bucket_metrics.swaps
+        span.set_attributes({
+            "comparisons": metrics.comparisons,
+            "swaps": metrics.swaps,
+            "array_size": n,
+            "buckets": num_buckets,
+            "threads": num_threads,
+            "engine": engine
+        })
+    return _undecorate(sorted_arr, restore), metrics
+
+def run_parallel_benchmark(size=200000, max_threads=None, seed=None):
+    with tracer.start_as_current_span("run_parallel_benchmark") as span:
+        max_threads = max_threads or os.cpu_count() or 1
+        data = random.Random(seed).sample(range(size * 10), size)
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+        print(f"\nSample sort paralelo ({size} elementos, GIL {'ativa' if gil_enabled else 'desativada'}):")
+        print("-" * 60)
+        for name, sort_fn in [("merge_sort", merge_sort), ("quick_sort", quick_sort),
+                              ("sorted", sorted)]:
+            start_time = time.perf_counter()
+            sort_fn(data)
+            print(f"{name}: {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+        engines = ["numpy", "tim_sort"] if np is not None else ["tim_sort"]
+        thread_counts = sorted({1 << i for i in range(max_threads.bit_length())} | {max_threads})
+        for engine in engines:
+            baseline = None
+            for num_threads in thread_counts:
+                start_time = time.perf_counter()
+                sample_sort(data, num_threads=num_threads, engine=engine)
+                execution_time = (time.perf_counter() - start_time) * 1000
+                baseline = baseline or execution_time
+                print(f"sample_sort[{engine}] {num_threads} thread(s): "
+                      f"{execution_time:.1f} ms ({baseline / execution_time:.2f}x)")
+
+        span.set_attributes({
+            "array_size": size,
+            "max_threads": max_threads,
+            "gil_enabled": gil_enabled
+        })
+
+# Ordenação em lote: muitos arrays pequenos e independentes ordenados juntos
+MAX_BATCH_ROW_SIZE = 64
+
+def batcher_network(n):
+    # Rede odd-even merge de Batcher para n arbitrário
+    pairs = []
+    p = 1
+    while p < n:
+        k = p
+        while k >= 1:
+            for j in range(k % p, n - k, 2 * k):
+                for i in range(min(k, n - j - k)):
+                    if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                        pairs.append((i + j, i + j + k))
+            k //= 2
+        p *= 2
+    return pairs
+
+def bose_nelson_network(n):
+    pairs = []
+
+    def p_bracket(i, x, j, y):
+        if x == 1 and y == 1:
+            pairs.append((i, j))
+        elif x == 1 and y == 2:
+            pairs.append((i, j + 1))
+            pairs.append((i, j))
+        elif x == 2 and y == 1:
+            pairs.append((i, j))
+            pairs.append((i + 1, j))
+        else:
+            a = x // 2
+            b = y // 2 if x % 2 else (y + 1) // 2
+            p_bracket(i, a, j, b)
+            p_bracket(i + a, x - a, j + b, y - b)
+            p_bracket(i + a, x - a, j, b)
+
+    def p_star(i, m):
+        if m > 1:
+            a = m // 2
+            p_star(i, a)
+            p_star(i + a, m - a)
+            p_bracket(i, a, i + a, m - a)
+
+    p_star(0, n)
+    return pairs
+
+SORTING_NETWORKS = {
+    "batcher": batcher_network,
+    "bose_nelson": bose_nelson_network,
+}
+
+_network_layers_cache = {}
+
+def network_layers(n, network="batcher"):
+    # Agrupa os comparadores em camadas sem índices em comum, para que
+    # cada camada vire uma única operação vetorizada sobre as colunas
+    cache_key = (n, network)
+    if cache_key not in _network_layers_cache:
+        depth = [0] * n
+        layers = []
+        for i, j in SORTING_NETWORKS[network](n):
+            level = max(depth[i], depth[j])
+            if level == len(layers):
+                layers.append(([], []))
+            layers[level][0].append(i)
+            layers[level][1].append(j)
+            depth[i] = depth[j] = level + 1
+        _network_layers_cache[cache_key] = [
+            (np.array(lo), np.array(hi)) for lo, hi in layers
+        ]
+    return _network_layers_cache[cache_key]
+
+def _network_sort_columns(cols, network, metrics):
+    for lo_idx, hi_idx in network_layers(cols.shape[0], network):
+        lo = cols[lo_idx]
+        hi = cols[hi_idx]
+        mask = lo > hi
+        cols[lo_idx] = np.where(mask, hi, lo)
+        cols[hi_idx] = np.where(mask, lo, hi)
+        metrics.comparisons += mask.size
+        metrics.swaps += int(np.count_nonzero(mask))
+
+def _insertion_sort_columns(cols, metrics):
+    n = cols.shape[0]
+    for i in range(1, n):
+        key = cols[i].copy()
+        active = np.ones(key.shape, dtype=bool)
+        for j in range(i - 1, -1, -1):
+            metrics.comparisons += int(np.count_nonzero(active))
+            move = active & (cols[j] > key)
+            stop = active & ~move
+            cols[j + 1] = np.where(move, cols[j], np.where(stop, key, cols[j + 1]))
+            metrics.swaps += int(np.count_nonzero(move))
+            active = move
+            if not active.any():
+                break
+        cols[0] = np.where(active, key, cols[0])
+
+def _insertion_sort_rows(rows, metrics):
+    # Caminho em Python puro (sem NumPy): uma única passada apertada,
+    # sem cópia, Metrics ou span por linha
+    comparisons = swaps = 0
+    for row in rows:
+        for i in range(1, len(row)):
+            key = row[i]
+            j = i - 1
+            while j >= 0:
+                comparisons += 1
+                if row[j] > key:
+                    row[j + 1] = row[j]
+                    swaps += 1
+                    j -= 1
+                else:
+                    break
+            row[j + 1] = key
+    metrics.comparisons += comparisons
+    metrics.swaps += swaps
+
+def _batch_row_size(batch):
+    # Valida o formato antes de qualquer conversão, com a mesma mensagem com ou sem NumPy
+    if np is not None and isinstance(batch, np.ndarray):
+        if batch.ndim != 2:
+            raise ValueError("O lote deve ser bidimensional (linhas x elementos)")
+        row_size = batch.shape[1]
+    else:
+        try:
+            row_size = len(batch[0])
+            ragged = any(len(row) != row_size for row in batch)
+        except TypeError:
+            ragged = True
+        if ragged:
+            raise ValueError("O lote deve ser bidimensional (linhas x elementos)")
+    if row_size > MAX_BATCH_ROW_SIZE:
+        raise ValueError(f"Linhas com no máximo {MAX_BATCH_ROW_SIZE} elementos")
+    return row_size
+
+def batch_sort(batch, method="batcher"):
+    # Devolve sempre uma lista de linhas (listas), com ou sem NumPy
+    if method not in SORTING_NETWORKS and method != "insertion":
+        valid = ", ".join(list(SORTING_NETWORKS) + ["insertion"])
+        raise ValueError(f"Método de lote desconhecido: {method!r} (use {valid})")
+    metrics = Metrics()
+    with tracer.start_as_current_span("batch_sort") as span:
+        if len(batch) == 0:
+            row_size = 0
+            sorted_batch = []
+        elif np is None:
+            if method != "insertion":
+                raise RuntimeError("NumPy é necessário para as redes de ordenação")
+            row_size = _batch_row_size(batch)
+            rows = [list(row) for row in batch]
+            _insertion_sort_rows(rows, metrics)
+            sorted_batch = rows
+        else:
+            row_size = _batch_row_size(batch)
+            arr = np.asarray(batch)
+            # Transposto e contíguo: cada coluna do lote vira uma linha de
+            # memória, então cada comparador atua sobre um vetor contínuo
+            cols = np.ascontiguousarray(arr.T)
+            if method == "insertion":
+                _insertion_sort_columns(cols, metrics)
+            else:
+                _network_sort_columns(cols, method, metrics)
+            sorted_batch = cols.T.tolist()
+        span.set_attributes({
+            "comparisons": metrics.comparisons,
+            "swaps": metrics.swaps,
+            "rows": len(sorted_batch),
+            "row_size": row_size,
+            "method": method
+        })
+    return sorted_batch, metrics
+
+def run_batch_benchmark(algorithms, num_rows=10000, row_size=10, seed=None):
+    with tracer.start_as_current_span("run_batch_benchmark") as span:
+        rng = random.Random(seed)
+        rows = [[rng.randint(100, 100000) for _ in range(row_size)]
+                for _ in range(num_rows)]
+        results = {}
+
+        methods = list(SORTING_NETWORKS) + ["insertion"] if np is not None else ["insertion"]
+        for method in methods:
+            start_time = time.perf_counter()
+            batch_sort(rows, method)
+            results[f"batch_sort[{method}]"] = num_rows / (time.perf_counter() - start_time)
+
+        for algo in algorithms:
+            start_time = time.perf_counter()
+            for row in rows:
+                algo(row)
+            results[algo.__name__] = num_rows / (time.perf_counter() - start_time)
+
+        span.set_attributes({
+            "rows": num_rows,
+            "row_size": row_size
+        })
+
+        print(f"\nVazão ({num_rows} linhas de {row_size} elementos):")
+        print("-" * 60)
+        for name, rows_per_second in results.items():
+            print(f"{name}: {rows_per_second:,.0f} linhas/s")
+
+DATASET_STRATEGIES = {
+    "unica": UniqueRandomNumberStrategy,
+    "paralela": ParallelUniqueRandomNumberStrategy,
+}
+
+# Acima deste tamanho a estratégia "auto" gera os dados em paralelo
+LARGE_DATASET_SIZE = ParallelUniqueRandomNumberStrategy.CHUNK_SIZE
+
+def _load_comparison_data(seed=None, corpus=None, num_elements=10, strategy="auto"):
+    if strategy == "auto":
+        large = np is not None and num_elements > LARGE_DATASET_SIZE
+        strategy = "paralela" if large else "unica"
+    if strategy == "paralela" and seed is None:
+        # Conjuntos grandes sempre vão para o corpus: sorteia e mostra a seed
+        seed = random.SystemRandom().randrange(2**32)
+        print(f"Seed gerada para o conjunto: {seed}")
+    # Com seed, o conjunto é reaproveitado do corpus em vez de sobrescrever Data.txt;
+    # sem seed os dados não são reproduzíveis e não vão para o corpus
+    if seed is None:
+        corpus = None
+    elif corpus is None:
+        corpus = DatasetCorpus()
+    generator = RandomNumberGenerator(DATASET_STRATEGIES[strategy](seed), corpus)
+    return generator.create_random_number_list(num_elements, 100, max(100000, 10 * num_elements))
 
 # Função de comparação com tracing
-def run_comparison(algorithms, num_executions=5):
+def run_comparison(algorithms, num_executions=5, seed=None, corpus=None,
+                   num_elements=10, strategy="auto"):
     with tracer.start_as_current_span("run_comparison") as span:
-        strategy = UniqueRandomNumberStrategy()
-        generator = RandomNumberGenerator(strategy)
-        generator.create_random_number_list(10, 100, 100000)
-        
-        original_data = load_data()
+        original_data = _load_comparison_data(seed, corpus, num_elements, strategy)
         results = {algo.__name__: {'times': [], 'comparisons': [], 'swaps': []} 
                   for algo in algorithms}
         
@@ -369,8 +884,358 @@ def run_comparison(algorithms, num_executions=5):
             print(f"Comparações: {mean(metrics['comparisons']):.0f}")
             print(f"Trocas: {mean(metrics['swaps']):.0f}")
 
+# Medição isolada: cada execução em processo próprio, CPU fixa e heap congelado
+# Primeiro método disponível entre fork e spawn (fork não existe no Windows)
+DEFAULT_START_METHOD = next(method for method in ("fork", "spawn")
+                            if method in multiprocessing.get_all_start_methods())
+
+class IsolationConfig:
+    def __init__(self, process=DEFAULT_START_METHOD, cpu=None, freeze_gc=True, cache="cold"):
+        # process: "fork", "spawn" (processo novo a cada medição) ou None (mesmo processo)
+        # cache: "cold" (cópia recém-alocada da entrada), "warm" (uma execução antes) ou None
+        self.process = process
+        self.cpu = cpu
+        self.freeze_gc = freeze_gc
+        self.cache = cache
+
+def _prepare_input(algo, data, cache):
+    # Mesma política de cache para o laço de referência e para a medição isolada;
+    # só a entrada é afetada, o estado do interpretador fica como está
+    if cache == "cold":
+        return list(data)
+    if cache == "warm":
+        algo(data)
+    return data
+
+def _isolated_measurement(algo, data, cpu, freeze_gc, cache):
+    previous_affinity = None
+    if cpu is not None:
+        if not hasattr(os, "sched_setaffinity"):
+            raise RuntimeError("Afinidade de CPU não é suportada nesta plataforma")
+        previous_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {cpu})
+    try:
+        # Sem gc.collect(): a coleta completa percorre o heap inteiro e tira do cache
+        # o estado do interpretador. gc.freeze() só move os objetos rastreados para
+        # a geração permanente, e gc.disable() impede coletas durante a medição
+        gc_was_enabled = gc.isenabled()
+        if freeze_gc:
+            gc.freeze()
+            gc.disable()
+        try:
+            arr = _prepare_input(algo, data, cache)
+            start_time = time.perf_counter()
+            _, metrics = algo(arr)
+            end_time = time.perf_counter()
+        finally:
+            if freeze_gc:
+                gc.unfreeze()
+                if gc_was_enabled:
+                    gc.enable()
+    finally:
+        if previous_affinity is not None:
+            os.sched_setaffinity(0, previous_affinity)
+    return (end_time - start_time) * 1000, metrics.comparisons, metrics.swaps
+
+def measure_isolated(algo, data, config):
+    args = (algo, data, config.cpu, config.freeze_gc, config.cache)
+    if config.process is None:
+        return _isolated_measurement(*args)
+    context = multiprocessing.get_context(config.process)
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_isolated_measurement, *args).result()
+
+def _coefficient_of_variation(times):
+    return stdev(times) / mean(times) if len(times) > 1 and mean(times) > 0 else 0.0
+
+def _confidence_interval(times, confidence=0.95):
+    # Meia largura do intervalo de confiança da média (aproximação normal,
+    # adequada a partir de ~30 amostras)
+    if len(times) < 2:
+        return 0.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return z * stdev(times) / sqrt(len(times))
+
+def run_isolated_comparison(algorithms, num_executions=30, config=None, seed=None, corpus=None,
+                            num_elements=10, strategy="auto"):
+    with tracer.start_as_current_span("run_isolated_comparison") as span:
+        config = config or IsolationConfig()
+        original_data = _load_comparison_data(seed, corpus, num_elements, strategy)
+        results = {algo.__name__: {'baseline': [], 'isolated': []} for algo in algorithms}
+
+        # Laço atual (mesmo processo, um algoritmo após o outro) como referência,
+        # com a mesma política de cache da medição isolada
+        for algo in algorithms:
+            for i in range(num_executions):
+                arr = _prepare_input(algo, original_data, config.cache)
+                start_time = time.perf_counter()
+                algo(arr)
+                end_time = time.perf_counter()
+                results[algo.__name__]['baseline'].append((end_time - start_time) * 1000)
+
+        for algo in algorithms:
+            for i in range(num_executions):
+                with tracer.start_as_current_span(f"{algo.__name__}_isolated_{i+1}") as exec_span:
+                    execution_time, comparisons, swaps = measure_isolated(algo, original_data, config)
+                    results[algo.__name__]['isolated'].append(execution_time)
+                    exec_span.set_attributes({
+                        "execution_time_ms": execution_time,
+                        "comparisons": comparisons,
+                        "swaps": swaps,
+                        "execution_number": i+1
+                    })
+
+        span.set_attributes({
+            "num_executions": num_executions,
+            "algorithms_tested": len(algorithms),
+            "process": str(config.process),
+            "cpu": -1 if config.cpu is None else config.cpu,
+            "freeze_gc": config.freeze_gc,
+            "cache": str(config.cache)
+        })
+
+        print(f"\nResultados isolados ({num_executions} execuções por algoritmo, IC de 95%):")
+        print("-" * 60)
+        if num_executions < 30:
+            print("Aviso: com menos de 30 execuções o CV e o intervalo de confiança são pouco confiáveis")
+        for algo_name, times in results.items():
+            print(f"\n{algo_name}:")
+            for label, key in [("laço atual", 'baseline'), ("isolado", 'isolated')]:
+                average = mean(times[key])
+                half_width = _confidence_interval(times[key])
+                print(f"Tempo ({label}): {average:.4f} ± {half_width:.4f} ms "
+                      f"(±{half_width / average:.1%}), CV {_coefficient_of_variation(times[key]):.1%}")
+            cv_baseline = _coefficient_of_variation(times['baseline'])
+            cv_isolated = _coefficient_of_variation(times['isolated'])
+            reduction = (1 - cv_isolated / cv_baseline) * 100 if cv_baseline else 0.0
+            # Menos variação só vale se a média não mudar: o desvio mostra o viés do isolamento
+            shift = (mean(times['isolated']) / mean(times['baseline']) - 1) * 100
+            print(f"Redução da variação: {reduction:.1f}% (desvio da média: {shift:+.1f}%)")
+            if abs(shift) > 10:
+                # Ex.: um processo novo paga páginas copy-on-write e caches frios do interpretador
+                print("Aviso: as médias diferem; os dois modos medem quantidades diferentes "
+                      "e a comparação dos CVs não é válida")
+        return results
+
+# Contagem genérica de operações: comparações via elementos proxy e movimentos
+# via um array instrumentado, sem alterar o código do algoritmo
+class OperationCounter:
+    __slots__ = ("comparisons", "moves")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+
+class CountingKey:
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counter.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        self.counter.comparisons += 1
+        return self.value != other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"CountingKey({self.value!r})"
+
+def counting_key(counter, key=None):
+    # Para ordenações que aceitam key=, como sorted(data, key=counting_key(counter))
+    if key is None:
+        return lambda x: CountingKey(x, counter)
+    return lambda x: CountingKey(key(x), counter)
+
+class InstrumentedArray:
+    # Conta como movimento cada escrita de elemento no array; leituras e cópias
+    # para listas comuns (fora do wrapper) não são vistas
+    __slots__ = ("data", "counter")
+
+    def __init__(self, data, counter):
+        self.data = data
+        self.counter = counter
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return InstrumentedArray(self.data[index], self.counter)
+        return self.data[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counter.moves += len(value)
+        else:
+            self.counter.moves += 1
+        self.data[index] = value
+
+    def append(self, value):
+        self.counter.moves += 1
+        self.data.append(value)
+
+    def extend(self, values):
+        values = list(values)
+        self.counter.moves += len(values)
+        self.data.extend(values)
+
+    def copy(self):
+        return InstrumentedArray(self.data.copy(), self.counter)
+
+def count_operations(sort_fn, data):
+    # sort_fn pode devolver (lista, metrics) como os algoritmos deste arquivo,
+    # uma nova sequência, ou None quando ordena no próprio array
+    counter = OperationCounter()
+    arr = InstrumentedArray([CountingKey(x, counter) for x in data], counter)
+    with tracer.start_as_current_span("count_operations") as span:
+        result = sort_fn(arr)
+        if isinstance(result, tuple):
+            result = result[0]
+        if result is None:
+            result = arr
+        # Se o resultado não é um array instrumentado, as escritas que o produziram
+        # (listas comuns, código em C) não foram vistas: movimentos indisponíveis
+        moves_available = isinstance(result, InstrumentedArray)
+        sorted_data = [item.value for item in result]
+        span.set_attributes({
+            "algorithm": getattr(sort_fn, "__name__", repr(sort_fn)),
+            "comparisons": counter.comparisons,
+            "moves": counter.moves,
+            "moves_available": moves_available,
+            "array_size": len(arr)
+        })
+    metrics = Metrics()
+    metrics.comparisons = counter.comparisons
+    metrics.swaps = counter.moves
+    metrics.moves_available = moves_available
+    return sorted_data, metrics
+
+def _format_moves(metrics):
+    return metrics.swaps if metrics.moves_available else "n/d"
+
+def builtin_sorted(arr):
+    return sorted(arr)
+
+def builtin_list_sort(arr):
+    items = list(arr)
+    items.sort()
+    return items
+
+def numpy_sort(arr):
+    return np.sort(np.array(list(arr), dtype=object))
+
+def run_operation_count(algorithms, seed=None, corpus=None, num_elements=10, strategy="auto"):
+    with tracer.start_as_current_span("run_operation_count") as span:
+        original_data = _load_comparison_data(seed, corpus, num_elements, strategy)
+
+        sort_functions = list(algorithms) + [builtin_sorted, builtin_list_sort]
+        if np is not None:
+            sort_functions.append(numpy_sort)
+
+        print("\nContagem de operações (manual x genérica):")
+        print("-" * 60)
+        for sort_fn in sort_functions:
+            _, generic = count_operations(sort_fn, original_data)
+            print(f"\n{sort_fn.__name__}:")
+            if sort_fn in algorithms:
+                _, manual = sort_fn(original_data)
+                print(f"Comparações: {manual.comparisons} manual, {generic.comparisons} genérica")
+                print(f"Trocas/movimentos: {manual.swaps} manual, {_format_moves(generic)} genérica")
+            else:
+                print(f"Comparações: {generic.comparisons} genérica")
+                print(f"Movimentos: {_format_moves(generic)} genérica")
+        span.set_attribute("algorithms_tested", len(sort_functions))
+
+# Ordenação de registros por um ou mais campos
+def generate_records(num, seed=None):
+    rng = random.Random(seed)
+    return [(rng.randint(0, 100), rng.uniform(-1000, 1000), f"item{rng.randint(0, 999):03d}",
+             rng.randint(0, 10**6)) for _ in range(num)]
+
+def run_record_benchmark(algorithms, sizes=(100, 1000), seed=None):
+    with tracer.start_as_current_span("run_record_benchmark") as span:
+        print("\nOrdenação de registros (key=itemgetter dos primeiros campos):")
+        print("-" * 60)
+        for size in sizes:
+            records = generate_records(size, seed)
+            for num_fields in range(1, 5):
+                key = itemgetter(*range(num_fields))
+                expected = sorted(records, key=key)
+                print(f"\n{size} registros, {num_fields} campo(s):")
+
+                start_time = time.perf_counter()
+                sorted(records, key=key)
+                print(f"sorted: {(time.perf_counter() - start_time) * 1000:.2f} ms")
+
+                for algo in algorithms:
+                    start_time = time.perf_counter()
+                    result, _ = algo(records, key=key)
+                    execution_time = (time.perf_counter() - start_time) * 1000
+                    status = "" if result == expected else " (ordem incorreta)"
+                    print(f"{algo.__name__}: {execution_time:.2f} ms{status}")
+        span.set_attributes({
+            "sizes": list(sizes),
+            "algorithms_tested": len(algorithms)
+        })
+
 # Executar
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comparação de algoritmos de ordenação")
+    parser.add_argument("modo", nargs="?", default="comparacao",
+                        choices=["comparacao", "lote", "isolado", "operacoes", "registros", "paralelo"])
+    parser.add_argument("--linhas", type=int, default=10000,
+                        help="Número de linhas no modo lote")
+    parser.add_argument("--tamanho", type=int, default=10,
+                        help="Elementos por linha no modo lote")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semente para gerar dados reproduzíveis")
+    parser.add_argument("--corpus", default="corpus",
+                        help="Diretório do corpus de dados gerados com seed")
+    parser.add_argument("--elementos", type=int, default=10,
+                        help="Tamanho do conjunto de dados nos modos comparacao, isolado e operacoes")
+    parser.add_argument("--estrategia", default="auto", choices=["auto"] + list(DATASET_STRATEGIES),
+                        help="Geração dos dados; auto usa a paralela (e o corpus) para conjuntos grandes")
+    parser.add_argument("--execucoes", type=int, default=None,
+                        help="Execuções por algoritmo (padrão: 5 na comparação, 30 no modo isolado)")
+    parser.add_argument("--processo", default=DEFAULT_START_METHOD,
+                        choices=[method for method in ("fork", "spawn")
+                                 if method in multiprocessing.get_all_start_methods()] + ["nenhum"],
+                        help="Como isolar cada medição no modo isolado")
+    parser.add_argument("--cpu", type=int, default=None,
+                        help="CPU à qual fixar as medições no modo isolado")
+    parser.add_argument("--cache", default="frio", choices=["frio", "quente", "nenhum"],
+                        help="Estado do cache antes de cada medição no modo isolado")
+    parser.add_argument("--sem-gc-freeze", action="store_true",
+                        help="Não congelar o heap com gc.freeze() no modo isolado")
+    args = parser.parse_args()
+
     with tracer.start_as_current_span("main"):
         algorithms = [
             bubble_sort,
@@ -382,7 +1247,28 @@ if __name__ == "__main__":
             tim_sort,
             shell_sort
         ]
-        run_comparison(algorithms, num_executions=5)
+        corpus = DatasetCorpus(args.corpus)
+        dataset = {"num_elements": args.elementos, "strategy": args.estrategia}
+        if args.modo == "lote":
+            run_batch_benchmark(algorithms, args.linhas, args.tamanho, args.seed)
+        elif args.modo == "paralelo":
+            run_parallel_benchmark(seed=args.seed)
+        elif args.modo == "registros":
+            run_record_benchmark(algorithms, seed=args.seed)
+        elif args.modo == "operacoes":
+            run_operation_count(algorithms, seed=args.seed, corpus=corpus, **dataset)
+        elif args.modo == "isolado":
+            config = IsolationConfig(
+                process=None if args.processo == "nenhum" else args.processo,
+                cpu=args.cpu,
+                freeze_gc=not args.sem_gc_freeze,
+                cache={"frio": "cold", "quente": "warm", "nenhum": None}[args.cache]
+            )
+            run_isolated_comparison(algorithms, num_executions=args.execucoes or 30, config=config,
+                                    seed=args.seed, corpus=corpus, **dataset)
+        else:
+            run_comparison(algorithms, num_executions=args.execucoes or 5, seed=args.seed,
+                           corpus=corpus, **dataset)
     
     # Forçar envio dos traces e encerrar
     trace.get_tracer_provider().force_flush()
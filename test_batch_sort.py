@@ -0,0 +1,62 @@
+import itertools
+import random
+
+import pytest
+
+import app
+from app import SORTING_NETWORKS, batch_sort
+
+
+def _apply_network(pairs, row):
+    row = list(row)
+    for i, j in pairs:
+        if row[i] > row[j]:
+            row[i], row[j] = row[j], row[i]
+    return row
+
+
+@pytest.mark.parametrize("network", list(SORTING_NETWORKS))
+@pytest.mark.parametrize("n", range(2, 65))
+def test_network_sorts_all_zero_one_inputs(network, n):
+    # Princípio 0/1: uma rede que ordena todas as entradas 0/1 ordena qualquer entrada.
+    # Exaustivo até n = 12; acima disso, uma amostra grande de entradas 0/1
+    pairs = SORTING_NETWORKS[network](n)
+    if n <= 12:
+        inputs = itertools.product((0, 1), repeat=n)
+    else:
+        rng = random.Random(n)
+        inputs = ([int(rng.random() < p) for _ in range(n)]
+                  for p in (0.1, 0.3, 0.5, 0.7, 0.9) for _ in range(200))
+    for row in inputs:
+        assert _apply_network(pairs, row) == sorted(row)
+
+
+@pytest.mark.parametrize("method", list(SORTING_NETWORKS) + ["insertion"])
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 10, 16, 33, 64])
+def test_batch_sort_matches_sorted(method, n):
+    rng = random.Random(f"{method}-{n}")
+    rows = [[rng.randint(0, 20) for _ in range(n)] for _ in range(300)]
+    sorted_batch, _ = batch_sort(rows, method)
+    assert sorted_batch == [sorted(row) for row in rows]
+
+
+def test_batch_sort_zero_one_exhaustive_vectorized():
+    # Mesmo princípio 0/1, agora pelo caminho vetorizado (camadas sobre colunas)
+    for n in range(2, 15):
+        rows = [list(bits) for bits in itertools.product((0, 1), repeat=n)]
+        for method in list(SORTING_NETWORKS) + ["insertion"]:
+            assert batch_sort(rows, method)[0] == [sorted(row) for row in rows]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_batch_sort_validation(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(app, "np", None)
+    method = "insertion"
+    assert batch_sort([], method)[0] == []
+    with pytest.raises(ValueError, match="bidimensional"):
+        batch_sort([[1, 2], [3]], method)
+    with pytest.raises(ValueError, match="no máximo"):
+        batch_sort([list(range(65))], method)
+    with pytest.raises(ValueError, match="desconhecido"):
+        batch_sort([[1, 2]], "bitonic")
@@ -0,0 +1,50 @@
+import random
+from operator import itemgetter
+
+import pytest
+
+from app import (_float_sort_keys, bubble_sort, bubble_sort_improved, insertion_sort,
+                 merge_sort, quick_sort, selection_sort, shell_sort, tim_sort)
+
+ALGORITHMS = [bubble_sort, bubble_sort_improved, insertion_sort, selection_sort,
+              quick_sort, merge_sort, tim_sort, shell_sort]
+
+
+def _records(rng, n):
+    # Poucos valores distintos em cada campo para haver muitas chaves iguais
+    floats = [-0.0, 0.0, -1.5, 1.5, -1e300, 1e-300, -7.25, float("inf"), float("-inf")]
+    return [(rng.randint(-3, 3), rng.choice(floats), rng.choice([2, 2.5, -1, -1.0]),
+             rng.choice("abc"), i) for i in range(n)]
+
+
+KEYS = {
+    "none": None,
+    "int": itemgetter(0),
+    "negative_int": lambda r: -r[0] * 10**12,
+    "float": itemgetter(1),
+    "mixed": itemgetter(2),
+    "tuple": itemgetter(3, 1),
+}
+
+
+@pytest.mark.parametrize("algo", ALGORITHMS, ids=lambda a: a.__name__)
+@pytest.mark.parametrize("key_name", list(KEYS))
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_and_reverse_match_sorted(algo, key_name, reverse):
+    rng = random.Random(f"{algo.__name__}-{key_name}-{reverse}")
+    key = KEYS[key_name]
+    for n in (0, 1, 2, 5, 60):
+        records = _records(rng, n)
+        result, _ = algo(records, key=key, reverse=reverse)
+        # Comparar registros inteiros também verifica a estabilidade (o último campo é a posição)
+        assert result == sorted(records, key=key, reverse=reverse)
+
+
+def test_float_sort_keys_preserve_order():
+    values = [float("-inf"), -1e300, -7.25, -1.5, -1e-300, -0.0, 0.0, 1e-300, 1.5, 1e300,
+              float("inf")]
+    keys = _float_sort_keys(values)
+    assert keys == sorted(keys)
+    # -0.0 e 0.0 são iguais para o Python e precisam da mesma chave
+    assert _float_sort_keys([-0.0]) == _float_sort_keys([0.0])
+    assert len(set(keys)) == len(values) - 1
@@ -0,0 +1,42 @@
+import random
+from operator import itemgetter
+
+import pytest
+
+from app import sample_sort
+
+
+def _random_data(rng, kind, n):
+    if kind == "int":
+        return [rng.randint(-50, 50) for _ in range(n)]
+    if kind == "float":
+        return [rng.uniform(-50, 50) for _ in range(n)]
+    if kind == "mixed":
+        return [rng.choice([rng.randint(-50, 50), rng.uniform(-50, 50)]) for _ in range(n)]
+    if kind == "big_int":
+        return [rng.choice([2**53 + 1, 2**64, -2**70, rng.randint(-50, 50)]) for _ in range(n)]
+    return [(rng.randint(0, 5), rng.uniform(-1, 1)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "tim_sort"])
+@pytest.mark.parametrize("kind", ["int", "float", "mixed", "big_int", "tuple"])
+def test_sample_sort_matches_sorted(engine, kind):
+    rng = random.Random(f"{engine}-{kind}")
+    for n in (0, 1, 2, 10, 3000, 20000):
+        data = _random_data(rng, kind, n)
+        keys = [None, lambda x: x] + ([itemgetter(0)] if kind == "tuple" else [abs])
+        for key in keys:
+            for reverse in (False, True):
+                result, _ = sample_sort(data, key=key, reverse=reverse,
+                                        num_threads=rng.choice([1, 3, 8]), engine=engine)
+                expected = sorted(data, key=key, reverse=reverse)
+                assert result == expected
+                assert [type(x) for x in result] == [type(x) for x in expected]
+
+
+def test_sample_sort_keeps_exact_values():
+    assert sample_sort([(2, 1), (1, 2), (0, 5)])[0] == [(0, 5), (1, 2), (2, 1)]
+    assert sample_sort([3.0, -1.0], key=lambda x: x)[0] == [-1.0, 3.0]
+    assert sample_sort([3, 1.5, 2], key=lambda x: x)[0] == [1.5, 2, 3]
+    assert sample_sort([3, 1, 2.5])[0] == [1, 2.5, 3]
+    assert sample_sort([2**53 + 1, 0])[0] == [0, 2**53 + 1]